@@ -1,8 +1,19 @@
-from dataclasses import dataclass
-from typing import List, Optional, Union
+import hashlib
+import io
+import os
+import pickle
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import cached_property, lru_cache, partial
+from itertools import chain
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple, Union
 
 import requests
-from bs4 import BeautifulSoup
+import requests_cache
+from lxml import html as lxml_html
+from requests.adapters import HTTPAdapter
 
 import pandas as pd
 import numpy as np
@@ -13,6 +24,19 @@ from hyrox.plot import highlight_some
 from hyrox.utils import ordinal, time_to_seconds
 
 
+MAX_WORKERS = 16
+
+# Per-user rather than the working directory since cached pickles are trusted
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "hyrox"
+# Bump when the IndividualDetails fields change so old pickles are not served
+CACHE_VERSION = 1
+
+# First link within each row of the first results list
+HREF_XPATH = (
+    '(//div[contains(@class, "col-sm-12") and contains(@class, "row-xs")])[1]'
+    "//li/descendant::a[1]/@href"
+)
+
 EXERCISES = [
     "1000m SkiErg",
     "50m Sled Push",
@@ -37,6 +61,36 @@ SPLIT_INDEX = pd.MultiIndex.from_product(
 )
 
 
+@lru_cache(maxsize=None)
+def get_session() -> requests_cache.CachedSession:
+    """Shared session which caches responses on disk and pools connections.
+
+    Results pages are historical so the responses never expire.
+
+    """
+    session = requests_cache.CachedSession(CACHE_DIR / "http_cache", expire_after=None)
+    adapter = HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=2 * MAX_WORKERS)
+    session.mount("https://", adapter)
+
+    return session
+
+
+def get_response(url: str) -> requests.Response:
+    response = get_session().get(url)
+    response.raise_for_status()
+
+    return response
+
+
+@lru_cache(maxsize=None)
+def running_mask(splits: Tuple[str, ...]) -> np.ndarray:
+    """Mask of the running splits, computed once per layout of the workout result."""
+    mask = np.array(["Running" in split for split in splits], dtype=bool)
+    mask.flags.writeable = False
+
+    return mask
+
+
 def normalize(df: pd.DataFrame, log: bool = True) -> pd.DataFrame:
     transform = np.log if log else lambda x: x
     return df.pipe(transform).pipe(lambda df: (df - df.mean()) / df.std())
@@ -51,47 +105,88 @@ class IndividualDetails:
     """
 
     participant: pd.Series
-    scoring: pd.DataFrame
     workout_result: pd.DataFrame
-    judge_decision: pd.DataFrame
     overall_time: pd.DataFrame
     splits: pd.DataFrame
+    scoring_html: Optional[str] = field(default=None, repr=False)
+    judge_decision_html: Optional[str] = field(default=None, repr=False)
+
+    @cached_property
+    def scoring(self) -> pd.DataFrame:
+        if self.scoring_html is None:
+            raise ValueError("No scoring table, scoring_html was not provided.")
+
+        return read_table(self.scoring_html)
+
+    @cached_property
+    def judge_decision(self) -> pd.DataFrame:
+        if self.judge_decision_html is None:
+            raise ValueError(
+                "No judge decision table, judge_decision_html was not provided."
+            )
+
+        return read_table(self.judge_decision_html)
+
+    @cached_property
+    def _rank(self) -> int:
+        return int(self.overall_time.iat[0, 1])
 
     def get_rank(self) -> int:
-        return int(self.overall_time[1].iloc[0])
+        return self._rank
+
+    @cached_property
+    def _name_with_rank(self) -> str:
+        return f"{ordinal(self.get_rank())} " + self.participant["Name"]
 
     def get_name(self, with_rank: bool = False) -> str:
-        name = self.participant["Name"]
         if with_rank:
-            name = f"{ordinal(self.get_rank())} " + name
+            return self._name_with_rank
 
-        return name
+        return self.participant["Name"]
 
     def get_exercises(self) -> pd.Series:
         return self.workout_result["seconds"]
 
-    def get_runs(self) -> pd.Series:
-        idx = self.workout_result.index.str.contains("Running")
-        ser = self.workout_result.loc[idx, "seconds"]
-        ser.index = range(1, len(ser) + 1)
-        ser.index.name = "Run"
+    @cached_property
+    def _runs(self) -> pd.Series:
+        idx = running_mask(tuple(self.workout_result.index))
+        seconds = self.workout_result["seconds"].to_numpy()[idx]
 
-        return ser
+        return pd.Series(
+            seconds,
+            index=pd.RangeIndex(1, len(seconds) + 1, name="Run"),
+            name="seconds",
+        )
 
-    def get_other_exercises(self) -> pd.Series:
+    def get_runs(self) -> pd.Series:
+        return self._runs.copy()
+
+    @cached_property
+    def _other_exercises(self) -> pd.Series:
         ser = self.workout_result.iloc[1:-2:2]["seconds"]
         ser.index.name = "Exercise"
 
         return ser
 
+    def get_other_exercises(self) -> pd.Series:
+        return self._other_exercises.copy()
+
     def percent_running(self) -> float:
         runs = self.get_runs()
         other = self.get_other_exercises()
 
         return runs.sum() / (runs.sum() + other.sum())
 
+    @cached_property
+    def _roxzone_time(self) -> float:
+        return self.workout_result.at["Roxzone Time", "seconds"]
+
     def get_roxzone_time(self) -> float:
-        return self.workout_result.loc["Roxzone Time", "seconds"]
+        return self._roxzone_time
+
+    def get_overall_time(self) -> str:
+        is_overall = self.overall_time[0].to_numpy() == "Overall Time"
+        return self.overall_time[1].to_numpy()[is_overall][0]
 
     def get_splits(self) -> pd.DataFrame:
         if "seconds" not in self.splits.columns:
@@ -103,21 +198,63 @@ class IndividualDetails:
     def get_rest_times(self) -> pd.Series:
         return self.get_splits()["diff"].rename("seconds")
 
+    def to_pickle(self, path: Path) -> None:
+        """Write the individual to path atomically."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as f:
+            try:
+                pickle.dump(self, f)
+            except BaseException:
+                f.close()
+                os.unlink(f.name)
+                raise
+
+        os.replace(f.name, path)
+
     @classmethod
-    def from_url(cls, individual_url: str) -> "IndividualDetails":
+    def from_pickle(cls, path: Path) -> "IndividualDetails":
+        with path.open(mode="rb") as f:
+            return pickle.load(f)
+
+    @classmethod
+    def from_url(cls, individual_url: str, cache: bool = True) -> "IndividualDetails":
+        """Load the individual from the results page.
+
+        The parsed individual is cached on disk under CACHE_DIR keyed by the URL.
+        Unreadable cache files are treated as a cache miss.
+
+        Cache files are unpickled, which can run arbitrary code, so CACHE_DIR
+        must only be writable by trusted users. Pass cache=False otherwise.
+
+        """
+        path = get_cache_path(individual_url)
+        if cache and path.exists():
+            try:
+                individual = cls.from_pickle(path)
+            except Exception as e:
+                print(f"Error reading cache {path} for {individual_url}: {e}")
+            else:
+                if isinstance(individual, cls):
+                    return individual
+
         try:
-            dfs = pd.read_html(individual_url)
+            tables = read_tables(get_response(individual_url).content, n=6)
+            participant, workout_result, overall_time, splits = (
+                tables[i][1] for i in (0, 2, 4, 5)
+            )
         except Exception as e:
             print(f"Error loading {individual_url}: {e}")
             return None
 
         individual = cls(
-            participant=dfs[0].set_index(0).squeeze(),
-            scoring=dfs[1],
-            workout_result=dfs[2].set_index("Split"),
-            judge_decision=dfs[3],
-            overall_time=dfs[4],
-            splits=dfs[5],
+            participant=pd.Series(
+                participant[1].to_numpy(), index=participant[0].to_numpy()
+            ),
+            workout_result=workout_result.set_index("Split"),
+            overall_time=overall_time,
+            splits=splits,
+            scoring_html=tables[1][0],
+            judge_decision_html=tables[3][0],
         )
 
         individual.workout_result["seconds"] = time_to_seconds(
@@ -127,6 +264,12 @@ class IndividualDetails:
         individual.splits["seconds"] = time_to_seconds(individual.splits["Time"])
         individual.splits["diff"] = individual.splits["seconds"].diff().shift(-1)
 
+        if cache:
+            try:
+                individual.to_pickle(path)
+            except Exception as e:
+                print(f"Error writing cache {path} for {individual_url}: {e}")
+
         return individual
 
 
@@ -138,23 +281,20 @@ class Details:
         return self.individuals[idx]
 
     @classmethod
-    def from_urls(cls, urls: List[str]) -> "Details":
-        hrefs = []
-        for url in urls:
-            hrefs.extend(get_all_hrefs(url))
-
-        hrefs = list(set(hrefs))
-
-        # TODO: Parallelize this
-        individuals = []
-        for url in hrefs:
-            try:
-                individual = IndividualDetails.from_url(url)
-            except Exception as e:
-                print(f"Error loading {url}: {e}")
-            else:
-                if individual is not None:
-                    individuals.append(individual)
+    def from_urls(
+        cls, urls: List[str], max_workers: int = MAX_WORKERS, cache: bool = True
+    ) -> "Details":
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            hrefs = chain.from_iterable(executor.map(get_all_hrefs, urls))
+            hrefs = list(set(hrefs))
+
+            individuals = list(
+                executor.map(partial(load_individual, cache=cache), hrefs)
+            )
+
+        individuals = [
+            individual for individual in individuals if individual is not None
+        ]
 
         return cls(individuals=individuals)
 
@@ -187,45 +327,26 @@ class Details:
         return cls(individuals=individuals)
 
     def get_exercises(self, with_rank: bool = True) -> pd.Series:
-        return pd.concat(
-            [
-                individual.get_exercises().rename(
-                    individual.get_name(with_rank=with_rank)
-                )
-                for individual in self.individuals
-            ],
-            axis=1,
-        ).T
+        return combine(
+            self.individuals,
+            IndividualDetails.get_exercises,
+            with_rank=with_rank,
+            axis=0,
+        )
 
     def get_runs(self, with_rank: bool = True) -> pd.DataFrame:
-        return pd.concat(
-            [
-                individual.get_runs().rename(individual.get_name(with_rank=with_rank))
-                for individual in self.individuals
-            ],
-            axis=1,
+        return combine(
+            self.individuals, IndividualDetails.get_runs, with_rank=with_rank
         )
 
     def get_other_exercises(self, with_rank: bool = True) -> pd.DataFrame:
-        return pd.concat(
-            [
-                individual.get_other_exercises().rename(
-                    individual.get_name(with_rank=with_rank)
-                )
-                for individual in self.individuals
-            ],
-            axis=1,
+        return combine(
+            self.individuals, IndividualDetails.get_other_exercises, with_rank=with_rank
         )
 
     def get_rest_times(self, with_rank: bool = True) -> pd.DataFrame:
-        return pd.concat(
-            [
-                individual.get_rest_times().rename(
-                    individual.get_name(with_rank=with_rank)
-                )
-                for individual in self.individuals
-            ],
-            axis=1,
+        return combine(
+            self.individuals, IndividualDetails.get_rest_times, with_rank=with_rank
         )
 
     def plot_splits(
@@ -278,6 +399,88 @@ class Details:
         )
 
 
+def get_cache_path(url: str) -> Path:
+    key = hashlib.md5(f"{CACHE_VERSION}:{url}".encode()).hexdigest()
+    return CACHE_DIR / f"{key}.pkl"
+
+
+def load_individual(url: str, cache: bool = True) -> Optional[IndividualDetails]:
+    try:
+        return IndividualDetails.from_url(url, cache=cache)
+    except Exception as e:
+        print(f"Error loading {url}: {e}")
+        return None
+
+
+def combine(
+    individuals: List[IndividualDetails],
+    get_series: Callable[[IndividualDetails], pd.Series],
+    with_rank: bool = True,
+    axis: int = 1,
+) -> pd.DataFrame:
+    """Combine a series from each individual as the columns (axis=1) or rows
+    (axis=0) of a DataFrame."""
+    return stack_series(
+        [get_series(individual) for individual in individuals],
+        [individual.get_name(with_rank=with_rank) for individual in individuals],
+        axis=axis,
+    )
+
+
+def stack_series(
+    series: List[pd.Series], names: List[str], axis: int = 1
+) -> pd.DataFrame:
+    """Stack the series as the named columns (axis=1) or rows (axis=0).
+
+    When every series shares the same index the values are filled into a
+    preallocated array rather than aligned.
+
+    """
+    index = series[0].index if series else pd.Index([])
+    if all(ser.index.equals(index) for ser in series[1:]):
+        dtype = np.result_type(*(ser.dtype for ser in series)) if series else float
+        data = np.empty((len(series), len(index)), dtype=dtype)
+        for i, ser in enumerate(series):
+            data[i] = ser.to_numpy()
+
+        if axis == 0:
+            return pd.DataFrame(data, index=names, columns=index)
+
+        return pd.DataFrame(data.T, index=index, columns=names)
+
+    df = pd.concat(series, axis=1, keys=range(len(series)))
+    df.columns = names
+
+    return df.T if axis == 0 else df
+
+
+def read_tables(html: bytes, n: int) -> List[Tuple[str, pd.DataFrame]]:
+    """Markup and DataFrame of the first n tables of the page which pd.read_html
+    returns, parsing the page only once with lxml.
+
+    Tables which pd.read_html drops, such as hidden or empty ones, are skipped
+    so the positions match those of pd.read_html on the whole page.
+
+    """
+    tables = []
+    for table in lxml_html.fromstring(html).xpath("//table"):
+        markup = lxml_html.tostring(table, encoding="unicode", with_tail=False)
+        try:
+            df = read_table(markup)
+        except (ValueError, IndexError):
+            continue
+
+        tables.append((markup, df))
+        if len(tables) == n:
+            return tables
+
+    raise ValueError(f"Expected {n} tables but found {len(tables)}")
+
+
+def read_table(markup: str) -> pd.DataFrame:
+    return pd.read_html(io.StringIO(markup), flavor="lxml")[0]
+
+
 def get_base_url(url) -> str:
     base_url = url.split("?")[0]
 
@@ -294,24 +497,13 @@ def get_all_hrefs(url: str) -> List[str]:
     https://results.hyrox.com/season-6/?page=2&event=HPRO_JGDMS4JI619&pid=list&pidp=ranking_nav&ranking=time_finish_netto&search%5Bsex%5D=M&search%5Bage_class%5D=%25&search%5Bnation%5D=%25
 
     """
-    # creating requests object
-    html = requests.get(url).content
-
-    # creating soup object
-    data = BeautifulSoup(html, "html.parser")
+    html = get_response(url).content
 
-    div = data.find("div", {"class": "col-sm-12 row-xs"})
-    rows = div.find_all("li")
-
-    def get_href(row):
-        a = row.find("a")
-        if a is None:
-            return None
-
-        return a["href"]
+    tree = lxml_html.fromstring(html)
+    hrefs = tree.xpath(HREF_XPATH)
 
     base_url = get_base_url(url)
-    return [f"{base_url}{get_href(row)}" for row in rows]
+    return [f"{base_url}{href}" for href in hrefs]
 
 
 def plot_splits(
@@ -320,21 +512,14 @@ def plot_splits(
     location: Optional[str] = None,
     fig: Optional[plt.Figure] = None,
 ) -> None:
-    running_times = pd.concat(
-        [
-            individual.get_runs().rename(individual.get_name(with_rank=True))
-            for individual in results
-        ],
-        axis=1,
-    )
+    names, runs, others = [], [], []
+    for individual in results:
+        names.append(individual.get_name(with_rank=True))
+        runs.append(individual.get_runs())
+        others.append(individual.get_other_exercises())
 
-    other_exercises = pd.concat(
-        [
-            individual.get_other_exercises().rename(individual.get_name(with_rank=True))
-            for individual in results
-        ],
-        axis=1,
-    )
+    running_times = stack_series(runs, names)
+    other_exercises = stack_series(others, names)
 
     NCOLS = 2
     if fig is None:
@@ -388,16 +573,14 @@ def plot_overall_times(
     results, ax: Optional[plt.Axes] = None, **plot_kwargs
 ) -> plt.Axes:
     overall_times = (
-        pd.concat(
-            [
-                result.overall_time.set_index(0)
-                .loc["Overall Time"]
-                .rename(result.get_name(with_rank=False))
-                for result in results
-            ],
-            axis=1,
+        pd.Series(
+            np.fromiter(
+                (result.get_overall_time() for result in results),
+                dtype=object,
+                count=len(results),
+            ),
+            index=[result.get_name(with_rank=False) for result in results],
         )
-        .T.squeeze()
         .pipe(time_to_seconds)
         .rename("Overall Time")
     )
@@ -1,8 +1,13 @@
 from typing import List, Optional, Union
 
+import numpy as np
 import pandas as pd
 
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
+
+
+FADED_KWARGS = ("color", "alpha", "linewidth", "lw", "linestyle", "ls", "zorder")
 
 
 def highlight_some(
@@ -11,17 +16,38 @@ def highlight_some(
     ax: Optional[plt.Axes] = None,
     **plot_kwargs,
 ) -> plt.Axes:
-    """Plot the dataframe columns along index with some highlighted."""
+    """Plot the dataframe columns along index with some highlighted.
+
+    The columns which are not highlighted are drawn as a single LineCollection
+    styled by the color, alpha, linewidth (lw), linestyle (ls) and zorder
+    keyword arguments. All other keyword arguments, e.g. logy, title or legend,
+    are passed to DataFrame.plot for the highlighted columns.
+
+    """
     ax = ax or plt.gca()
-    plot_kwargs = {
-        "legend": False,
+    faded_kwargs = {
         "color": "black",
         "alpha": 0.10,
-    } | plot_kwargs
+        "zorder": 1,
+    } | {key: plot_kwargs.pop(key) for key in FADED_KWARGS if key in plot_kwargs}
+    plot_kwargs = {"legend": True} | plot_kwargs
 
     if isinstance(highlight_idx, int):
         highlight_idx = list(range(highlight_idx))
 
-    df.plot(ax=ax, **plot_kwargs)
-    df.iloc[:, highlight_idx].plot(ax=ax, legend=True)
+    highlighted = set(np.arange(df.shape[1])[highlight_idx])
+
+    # Plot the highlighted columns first to reuse the x positions pandas chose
+    df.iloc[:, highlight_idx].plot(ax=ax, **plot_kwargs)
+    x = np.asarray(ax.get_lines()[-1].get_xdata(orig=False), dtype=float)
+
+    values = df.to_numpy(dtype=float)
+    segments = [
+        np.column_stack([x, values[:, i]])
+        for i in range(df.shape[1])
+        if i not in highlighted
+    ]
+    ax.add_collection(LineCollection(segments, **faded_kwargs))
+    ax.autoscale_view()
+
     return ax
@@ -1,21 +1,64 @@
+from functools import lru_cache
+from typing import Optional
+
 import pandas as pd
 import numpy as np
 
 
+_SUFFIX = ("th", "st", "nd", "rd", "th", "th", "th", "th", "th", "th")
+
+
+@lru_cache(maxsize=512)
 def ordinal(n: int):
-    if 11 <= (n % 100) <= 13:
-        suffix = "th"
-    else:
-        suffix = ["th", "st", "nd", "rd", "th"][min(n % 10, 4)]
+    suffix = _SUFFIX[0 if 11 <= (n % 100) <= 13 else n % 10]
     return str(n) + suffix
 
 
+def _parse_fixed_width(times: np.ndarray) -> Optional[np.ndarray]:
+    """Parse zero padded HH:MM:SS times with byte arithmetic.
+
+    Returns None if any of the times are not in the fixed width format.
+
+    """
+    try:
+        joined = ":".join(times).encode("ascii") + b":"
+    except (TypeError, UnicodeEncodeError):
+        return None
+
+    if len(joined) != 9 * len(times):
+        return None
+
+    chars = np.frombuffer(joined, dtype=np.uint8).reshape(-1, 9)
+    colons = chars[:, 2::3]
+    digits = np.delete(chars, [2, 5, 8], axis=1).astype(np.int64) - ord("0")
+    if (colons != ord(":")).any() or (digits < 0).any() or (digits > 9).any():
+        return None
+
+    hours = digits[:, 0] * 10 + digits[:, 1]
+    minutes = digits[:, 2] * 10 + digits[:, 3]
+    seconds = digits[:, 4] * 10 + digits[:, 5]
+
+    return hours * 60 * 60 + minutes * 60 + seconds
+
+
+def _hms_to_seconds(time: str) -> int:
+    hours, minutes, seconds = time.split(":")
+    return int(hours) * 60 * 60 + int(minutes) * 60 + int(seconds)
+
+
 def time_to_seconds(times: pd.Series) -> pd.Series:
-    null_rows = times == "–"
+    values = times.to_numpy(dtype=object, na_value="–")
+    valid = values != "–"
 
-    split = times.loc[~null_rows].str.split(":", expand=True).astype(int)
+    seconds = _parse_fixed_width(values[valid])
+    if seconds is None:
+        seconds = np.fromiter(
+            map(_hms_to_seconds, values[valid]), dtype=np.int64, count=valid.sum()
+        )
+    if valid.all():
+        return pd.Series(seconds, index=times.index)
 
-    multiplier = np.array([60 * 60, 60, 1])
-    result = split @ multiplier
+    result = np.full(len(values), np.nan)
+    result[valid] = seconds
 
-    return result.reindex(times.index)
+    return pd.Series(result, index=times.index)
@@ -0,0 +1,261 @@
+import io
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+
+import pandas as pd
+
+import hyrox.data
+from hyrox.data import (
+    IndividualDetails,
+    get_all_hrefs,
+    get_cache_path,
+    read_table,
+    read_tables,
+    stack_series,
+)
+
+
+HTML = (Path(__file__).parent / "data" / "individual.html").read_bytes()
+
+
+def test_stack_series_matching_index():
+    index = pd.Index(["Running 1", "1000m SkiErg", "Roxzone Time"], name="Split")
+    series = [
+        pd.Series([1.0, 2.0, 3.0], index=index),
+        pd.Series([4.0, 5.0, 6.0], index=index),
+    ]
+    actual = stack_series(series, ["a", "b"])
+
+    expected = pd.DataFrame(
+        {"a": [1.0, 2.0, 3.0], "b": [4.0, 5.0, 6.0]},
+        index=index,
+    )
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_stack_series_mismatched_index_keeps_order():
+    series = [
+        pd.Series([1.0, 2.0, 3.0], index=["Running 1", "1000m SkiErg", "Roxzone Time"]),
+        pd.Series([4.0], index=["Running 1"]),
+    ]
+    actual = stack_series(series, ["a", "b"])
+
+    assert actual.index.tolist() == ["Running 1", "1000m SkiErg", "Roxzone Time"]
+    assert actual["b"].isna().tolist() == [False, True, True]
+
+
+@pytest.mark.parametrize("same_index", [True, False])
+def test_stack_series_duplicate_names(same_index):
+    series = [
+        pd.Series([1.0, 2.0], index=["x", "y"]),
+        pd.Series([3.0, 4.0], index=["x", "y"] if same_index else ["x", "z"]),
+    ]
+    actual = stack_series(series, ["a", "a"])
+
+    assert actual.columns.tolist() == ["a", "a"]
+    assert actual.iloc[0].tolist() == [1.0, 3.0]
+
+    rows = stack_series(series, ["a", "a"], axis=0)
+    assert rows.index.tolist() == ["a", "a"]
+
+
+@pytest.mark.parametrize(
+    "dtypes, expected",
+    [
+        (["int64", "int64"], "int64"),
+        (["int64", "float64"], "float64"),
+    ],
+)
+def test_stack_series_keeps_dtype(dtypes, expected):
+    series = [pd.Series([1, 2], index=["x", "y"], dtype=dtype) for dtype in dtypes]
+
+    assert (stack_series(series, ["a", "b"]).dtypes == expected).all()
+    assert (stack_series(series, ["a", "b"], axis=0).dtypes == expected).all()
+
+
+@pytest.fixture
+def individual() -> IndividualDetails:
+    return IndividualDetails(
+        participant=pd.Series({"Name": "Athlete"}),
+        workout_result=pd.DataFrame(
+            {"Time": ["00:04:00"], "seconds": [240]},
+            index=pd.Index(["Running 1"], name="Split"),
+        ),
+        overall_time=pd.DataFrame({0: ["Rank", "Overall Time"], 1: ["1", "01:00:00"]}),
+        splits=pd.DataFrame({"Split": ["Running 1"], "Time": ["00:04:00"]}),
+    )
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(hyrox.data, "CACHE_DIR", tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def requested(monkeypatch):
+    urls = []
+
+    def get_response(url):
+        urls.append(url)
+        raise ConnectionError(url)
+
+    monkeypatch.setattr(hyrox.data, "get_response", get_response)
+    return urls
+
+
+def test_pickle_round_trip(individual, tmp_path):
+    path = tmp_path / "individual.pkl"
+    individual.to_pickle(path)
+
+    actual = IndividualDetails.from_pickle(path)
+
+    assert actual.get_name(with_rank=True) == "1st Athlete"
+    pd.testing.assert_frame_equal(actual.workout_result, individual.workout_result)
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_to_pickle_failure_removes_temp_file(individual, tmp_path):
+    individual.participant = lambda: None
+
+    with pytest.raises(Exception):
+        individual.to_pickle(tmp_path / "individual.pkl")
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_from_url_cache_hit(individual, cache_dir, requested):
+    url = "https://results.hyrox.com/index.php?idp=1"
+    individual.to_pickle(get_cache_path(url))
+
+    actual = IndividualDetails.from_url(url)
+
+    assert actual.get_name() == "Athlete"
+    assert requested == []
+
+
+def test_from_url_corrupt_cache_is_a_miss(cache_dir, requested):
+    url = "https://results.hyrox.com/index.php?idp=1"
+    get_cache_path(url).write_bytes(b"not a pickle")
+
+    assert IndividualDetails.from_url(url) is None
+    assert requested == [url]
+
+
+def test_from_url_without_cache(individual, cache_dir, requested):
+    url = "https://results.hyrox.com/index.php?idp=1"
+    individual.to_pickle(get_cache_path(url))
+
+    assert IndividualDetails.from_url(url, cache=False) is None
+    assert requested == [url]
+
+
+def test_cache_path_includes_version(monkeypatch):
+    url = "https://results.hyrox.com/index.php?idp=1"
+    path = get_cache_path(url)
+
+    monkeypatch.setattr(hyrox.data, "CACHE_VERSION", hyrox.data.CACHE_VERSION + 1)
+
+    assert get_cache_path(url) != path
+
+
+def test_from_url_cache_write_failure(monkeypatch, cache_dir):
+    monkeypatch.setattr(hyrox.data, "get_response", lambda url: Mock(content=HTML))
+
+    def to_pickle(self, path):
+        raise OSError("Read-only file system")
+
+    monkeypatch.setattr(IndividualDetails, "to_pickle", to_pickle)
+
+    actual = IndividualDetails.from_url("https://results.hyrox.com/index.php?idp=1")
+
+    assert actual.get_name(with_rank=True) == "12th Doe, John"
+
+
+def test_read_tables_matches_read_html():
+    expected = pd.read_html(io.StringIO(HTML.decode()), flavor="lxml")
+    actual = read_tables(HTML, n=len(expected))
+
+    assert len(expected) == 6
+    for (markup, act), exp in zip(actual, expected):
+        pd.testing.assert_frame_equal(act, exp)
+        pd.testing.assert_frame_equal(read_table(markup), exp)
+
+
+def test_read_tables_too_few():
+    with pytest.raises(ValueError, match="Expected 7 tables but found 6"):
+        read_tables(HTML, n=7)
+
+
+def test_from_url_parses_page(monkeypatch, cache_dir):
+    monkeypatch.setattr(hyrox.data, "get_response", lambda url: Mock(content=HTML))
+
+    individual = IndividualDetails.from_url("https://results.hyrox.com/index.php")
+
+    assert individual.get_name(with_rank=True) == "12th Doe, John"
+    assert individual.get_runs().tolist() == [240, 250]
+    assert individual.get_roxzone_time() == 300
+    assert individual.get_overall_time() == "01:05:30"
+    assert individual.scoring.columns.tolist() == ["Judge", "Points"]
+
+
+@pytest.mark.parametrize("table", ["scoring", "judge_decision"])
+def test_missing_lazy_table(individual, table):
+    with pytest.raises(ValueError, match=f"{table}_html was not provided"):
+        getattr(individual, table)
+
+
+def test_get_all_hrefs(monkeypatch):
+    html = b"""
+    <div class="col-sm-12 row-xs">
+      <ul>
+        <li><div><a href="?idp=1">First</a><a href="?other=1">Other</a></div></li>
+        <li>No link</li>
+        <li><a href="?idp=2">Second</a></li>
+      </ul>
+    </div>
+    <div class="col-sm-12 row-xs">
+      <ul><li><a href="?page=2">Next</a></li></ul>
+    </div>
+    """
+    monkeypatch.setattr(hyrox.data, "get_response", lambda url: Mock(content=html))
+
+    actual = get_all_hrefs("https://results.hyrox.com/season-6/?page=1")
+
+    assert actual == [
+        "https://results.hyrox.com/season-6/index.php?idp=1",
+        "https://results.hyrox.com/season-6/index.php?idp=2",
+    ]
+
+
+def test_cache_dir_is_per_user():
+    assert hyrox.data.CACHE_DIR.is_absolute()
+    assert hyrox.data.CACHE_DIR.name == "hyrox"
+
+
+@pytest.mark.parametrize("getter", ["get_runs", "get_other_exercises"])
+def test_getters_return_copies(individual, getter):
+    individual.workout_result = pd.DataFrame(
+        {"seconds": [240, 270, 250, 300, 10, 20]},
+        index=pd.Index(
+            [
+                "Running 1",
+                "1000m SkiErg",
+                "Running 2",
+                "50m Sled Push",
+                "Roxzone Time",
+                "Run Total",
+            ],
+            name="Split",
+        ),
+    )
+    expected = getattr(individual, getter)().copy()
+
+    ser = getattr(individual, getter)()
+    ser.index = range(len(ser))
+    ser.name = "changed"
+    ser.iloc[0] = -1
+
+    pd.testing.assert_series_equal(getattr(individual, getter)(), expected)
@@ -0,0 +1,58 @@
+import pytest
+
+import pandas as pd
+import numpy as np
+
+from matplotlib.figure import Figure
+
+from hyrox.plot import highlight_some
+
+
+@pytest.mark.parametrize(
+    "index",
+    [
+        pd.RangeIndex(1, 5),
+        pd.Index(["a", "b", "c", "d"]),
+        pd.date_range("2020-01-01", periods=4, freq="D"),
+        pd.date_range("2020-01-01", periods=4, freq="MS"),
+        pd.DatetimeIndex(["2020-01-01", "2020-01-03", "2020-02-01", "2020-03-01"]),
+    ],
+)
+def test_highlight_some_shares_x(index):
+    df = pd.DataFrame(np.arange(24).reshape(4, 6), index=index)
+    ax = Figure().subplots()
+
+    highlight_some(df, highlight_idx=2, ax=ax)
+
+    lines = ax.get_lines()
+    segments = ax.collections[0].get_segments()
+    assert len(lines) == 2
+    assert len(segments) == 4
+    for segment in segments:
+        np.testing.assert_allclose(segment[:, 0], lines[0].get_xdata(orig=False))
+
+
+def test_highlight_some_plot_kwargs():
+    df = pd.DataFrame(np.arange(1, 25).reshape(4, 6))
+    ax = Figure().subplots()
+
+    highlight_some(
+        df,
+        highlight_idx=2,
+        ax=ax,
+        logy=True,
+        title="Title",
+        style="--",
+        legend=False,
+        color="red",
+        lw=2,
+    )
+
+    assert ax.get_yscale() == "log"
+    assert ax.get_title() == "Title"
+    assert ax.get_legend() is None
+    assert [line.get_linestyle() for line in ax.get_lines()] == ["--", "--"]
+
+    collection = ax.collections[0]
+    np.testing.assert_allclose(collection.get_color(), [[1.0, 0.0, 0.0, 0.1]])
+    np.testing.assert_allclose(collection.get_linewidth(), [2])
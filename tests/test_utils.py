@@ -36,3 +36,28 @@ def test_time_to_seconds():
 
     expected = pd.Series([np.nan, 60, 60 * 60, 60 * 60])
     pd.testing.assert_series_equal(actual, expected)
+
+
+def test_time_to_seconds_keeps_index():
+    times = pd.Series(["00:00:30", "–", "02:03:04"], index=["a", "b", "c"])
+    actual = time_to_seconds(times)
+
+    expected = pd.Series([30, np.nan, 2 * 60 * 60 + 3 * 60 + 4], index=["a", "b", "c"])
+    pd.testing.assert_series_equal(actual, expected)
+
+
+def test_time_to_seconds_not_zero_padded():
+    times = pd.Series(["1:00:00", "00:01:00"])
+    actual = time_to_seconds(times)
+
+    expected = pd.Series([60 * 60, 60])
+    pd.testing.assert_series_equal(actual, expected)
+
+
+@pytest.mark.parametrize("dtype", ["object", "string"])
+def test_time_to_seconds_missing(dtype):
+    times = pd.Series(["00:01:00", None, "–"], dtype=dtype)
+    actual = time_to_seconds(times)
+
+    expected = pd.Series([60, np.nan, np.nan])
+    pd.testing.assert_series_equal(actual, expected)